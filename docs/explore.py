@@ -29,7 +29,7 @@ Usage:
     sudo python3 explore.py --raw          # continuous raw hex output
     sudo python3 explore.py --discover     # systematic bit discovery mode
 
-Requires: pyusb (pip install pyusb)
+Requires: libusb1 (pip install libusb1)
 Must stop scanner-watch.sh first:
     sudo kill $(pgrep -f scanner-watch)
 """
@@ -38,10 +38,11 @@ from __future__ import annotations
 
 import sys
 import time
+from collections import Counter
 from dataclasses import dataclass, field
+from operator import attrgetter
 
-import usb.core
-import usb.util
+import usb1
 
 
 # --- Device constants ---
@@ -54,6 +55,15 @@ EP_IN = 0x81
 USB_CMD_CODE = 0x43
 USB_CMD_LEN = 31
 USB_CMD_OFFSET = 19  # SCSI CDB starts here
+HW_STATUS_LEN = 12   # GET_HW_STATUS response length
+
+IN_BUF_LEN = 512
+USB_TIMEOUT_MS = 1000
+STATUS_TIMEOUT_MS = 200
+
+POLL_INTERVAL = 0.1    # seconds, while the state is steady
+BURST_INTERVAL = 0.01  # seconds, for BURST_WINDOW after a change
+BURST_WINDOW = 1.0     # seconds
 
 
 # --- Protocol helpers ---
@@ -67,11 +77,14 @@ def make_envelope(cdb: bytes) -> bytes:
 
 
 def hex_of(data: bytes) -> str:
-    return " ".join(f"{b:02x}" for b in data)
+    return data.hex(" ")
+
+
+_BITS = tuple(f"{b:08b}" for b in range(256))
 
 
 def bits_of(b: int) -> str:
-    return f"{b:08b}"
+    return _BITS[b]
 
 
 # SCSI CDB for GET_HW_STATUS: opcode 0xC2, alloc length 12 at bytes 7-8
@@ -82,9 +95,51 @@ GHS_CMD = make_envelope(GHS_CDB)
 TUR_CDB = bytes(6)
 TUR_CMD = make_envelope(TUR_CDB)
 
+# Envelopes sent every poll; each gets a pre-filled OUT transfer
+ENVELOPES = (GHS_CMD, TUR_CMD)
+
 
 # --- State decoding ---
 
+# Decoded HWStatus bits: (field, byte index, mask, inverted, diff label).
+# Mapping a newly discovered bit is a one-line addition here plus the
+# HWStatus field; from_response() decodes it and diff() reports it.
+_BIT_SCHEMA = (
+    ("hopper", 3, 0x80, True, "paper in feeder"),
+    ("adf_open", 3, 0x40, False, "ADF door open"),
+    ("paper_end", 3, 0x20, False, "paper path end"),
+    ("scan_sw", 4, 0x01, False, "scan button"),
+    ("manual_feed", 4, 0x02, False, "manual feed"),
+    ("send_sw", 4, 0x04, False, "send button"),
+)
+_DIFF_GETTERS = tuple((attrgetter(name), label) for name, *_, label in _BIT_SCHEMA)
+
+
+# raw_int keeps len(raw) above the response bytes, so a length change
+# (short responses are kept as-is) never compares equal
+_RAW_LEN_SHIFT = 8 * HW_STATUS_LEN
+
+
+def _raw_int(raw: bytes) -> int:
+    return int.from_bytes(raw, "little") | len(raw) << _RAW_LEN_SHIFT
+
+
+def _diff_mask(old: int, new: int) -> int:
+    """
+    Bitmask of byte indices that differ between two raw_int values.
+
+    Only bytes present in both responses are compared.
+    """
+    common = min(old >> _RAW_LEN_SHIFT, new >> _RAW_LEN_SHIFT)
+    x = (old ^ new) & ((1 << 8 * common) - 1)
+    mask = 0
+    while x:
+        i = ((x & -x).bit_length() - 1) >> 3  # lowest differing byte
+        mask |= 1 << i
+        x &= ~(0xFF << (i * 8))
+    return mask
+
+
 @dataclass(frozen=True)
 class HWStatus:
     """Decoded GET_HW_STATUS response. Immutable snapshot of scanner state."""
@@ -107,101 +162,237 @@ class HWStatus:
     b5: int = 0
     b6: int = 0
 
+    # raw (and its length) as one int, so a whole-response compare is one XOR
+    raw_int: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "raw_int", _raw_int(self.raw))
+
     @classmethod
-    def from_response(cls, data: bytes) -> HWStatus:
-        raw = bytes(data[:12]) if len(data) >= 12 else bytes(data)
-        b3 = raw[3] if len(raw) > 3 else 0
-        b4 = raw[4] if len(raw) > 4 else 0
-        b5 = raw[5] if len(raw) > 5 else 0
-        b6 = raw[6] if len(raw) > 6 else 0
+    def from_response(cls, data: bytes | memoryview) -> HWStatus:
+        raw = bytes(data[:HW_STATUS_LEN])
+        padded = raw.ljust(HW_STATUS_LEN, b"\0")  # short responses read as 0
 
         return cls(
             raw=raw,
-            hopper=not bool(b3 & 0x80),     # bit 7 inverted
-            adf_open=bool(b3 & 0x40),       # bit 6
-            paper_end=bool(b3 & 0x20),      # bit 5
-            scan_sw=bool(b4 & 0x01),        # bit 0
-            manual_feed=bool(b4 & 0x02),    # bit 1
-            send_sw=bool(b4 & 0x04),        # bit 2
-            b3=b3, b4=b4, b5=b5, b6=b6,
+            **{
+                name: bool(padded[i] & mask) != inverted
+                for name, i, mask, inverted, _ in _BIT_SCHEMA
+            },
+            b3=padded[3], b4=padded[4], b5=padded[5], b6=padded[6],
         )
 
+    @classmethod
+    def from_responses(cls, rows: bytes) -> list[HWStatus]:
+        """Decode back-to-back HW_STATUS_LEN-byte rows, as from poll_batch()."""
+        view = memoryview(rows)
+        return [
+            cls.from_response(view[start : start + HW_STATUS_LEN])
+            for start in range(0, len(view), HW_STATUS_LEN)
+        ]
+
     def diff(self, prev: HWStatus) -> list[str]:
-        """Human-readable list of fields that changed from prev."""
+        """
+        Human-readable list of fields that changed from prev.
+
+        Responses of different lengths are compared over their common
+        bytes, plus a length line:
+
+        >>> short = HWStatus.from_response(bytes([0, 0, 0, 0x80]))
+        >>> full = HWStatus.from_response(bytes([0, 0, 0, 0x80, 0, 0, 0, 0, 1, 0, 0, 0]))
+        >>> full.diff(short)
+        ['  length: 4 → 12 bytes']
+        >>> short.diff(full)
+        ['  length: 12 → 4 bytes']
+        >>> HWStatus.from_response(b"\\x01").diff(HWStatus.from_response(b"\\x01\\x00"))
+        ['  length: 2 → 1 bytes']
+        """
+        # Every field derives from raw; steady-state polls stop here
+        if self.raw_int == prev.raw_int:
+            return []
+
         changes = []
-        named_fields = [
-            ("hopper", "paper in feeder"),
-            ("adf_open", "ADF door open"),
-            ("paper_end", "paper path end"),
-            ("scan_sw", "scan button"),
-            ("manual_feed", "manual feed"),
-            ("send_sw", "send button"),
-        ]
-        for attr, label in named_fields:
-            old, new = getattr(prev, attr), getattr(self, attr)
+        for getter, label in _DIFF_GETTERS:
+            old, new = getter(prev), getter(self)
             if old != new:
                 changes.append(f"  {label}: {old} → {new}")
 
+        if len(prev.raw) != len(self.raw):
+            changes.append(f"  length: {len(prev.raw)} → {len(self.raw)} bytes")
+
         # Also flag any bit changes in raw bytes (catch unmapped bits)
-        for i in range(len(self.raw)):
+        mask = _diff_mask(prev.raw_int, self.raw_int)
+        while mask:
+            i = (mask & -mask).bit_length() - 1  # lowest changed byte
+            mask &= mask - 1
             old_b, new_b = prev.raw[i], self.raw[i]
-            if old_b != new_b:
-                changes.append(
-                    f"  byte[{i}]: 0x{old_b:02x} ({bits_of(old_b)}) "
-                    f"→ 0x{new_b:02x} ({bits_of(new_b)})"
-                )
+            changes.append(
+                f"  byte[{i}]: 0x{old_b:02x} ({bits_of(old_b)}) "
+                f"→ 0x{new_b:02x} ({bits_of(new_b)})"
+            )
         return changes
 
 
+def bit_stability(rows: bytes) -> tuple[bytes, list[list[int]]]:
+    """
+    Summarize packed HW_STATUS_LEN-byte rows (as from poll_batch()).
+
+    Returns (modal, counts): modal holds the most common value seen at
+    each byte position, and counts[i][bit] is how many rows had that bit
+    of byte i set. A bit is stable if its count is 0 or the row count.
+    """
+    modal = bytearray(HW_STATUS_LEN)
+    counts = []
+    for i in range(HW_STATUS_LEN):
+        column = rows[i::HW_STATUS_LEN]
+        modal[i] = Counter(column).most_common(1)[0][0]
+        counts.append([sum((b >> bit) & 1 for b in column) for bit in range(8)])
+    return bytes(modal), counts
+
+
 # --- USB communication ---
 
-def open_scanner() -> usb.core.Device:
-    """Find, claim, and configure the ScanSnap S1500."""
-    dev = usb.core.find(idVendor=VID, idProduct=PID)
-    if dev is None:
-        print("ScanSnap S1500 not found. Is the lid open?", file=sys.stderr)
-        sys.exit(1)
+@dataclass
+class Scanner:
+    """
+    Claimed S1500 handle plus the transfers for one 3-phase transaction.
+
+    The libusb transfers and their buffers are allocated once in
+    open_scanner() and resubmitted on every poll. There is one command
+    transfer per entry in ENVELOPES, already holding its envelope.
+    """
+
+    ctx: usb1.USBContext
+    handle: usb1.USBDeviceHandle
+    cmd_xfers: dict[bytes, usb1.USBTransfer]  # phase 1: envelope → EP_OUT
+    data_xfer: usb1.USBTransfer    # phase 2: data ← EP_IN
+    status_xfer: usb1.USBTransfer  # phase 3: 0x53 status ← EP_IN
+
+
+def _open_handle(ctx: usb1.USBContext) -> usb1.USBDeviceHandle | None:
+    handle = ctx.openByVendorIDAndProductID(VID, PID)
+    if handle is None:
+        return None
 
     # Detach kernel driver (SANE / libusb may have it)
     try:
-        if dev.is_kernel_driver_active(0):
-            dev.detach_kernel_driver(0)
+        if handle.kernelDriverActive(0):
+            handle.detachKernelDriver(0)
             print("(detached kernel driver)")
-    except (usb.core.USBError, NotImplementedError):
+    except usb1.USBError:
         pass
+    return handle
+
+
+def open_scanner() -> Scanner:
+    """Find, claim, and configure the ScanSnap S1500."""
+    ctx = usb1.USBContext()
+    handle = _open_handle(ctx)
+    if handle is None:
+        print("ScanSnap S1500 not found. Is the lid open?", file=sys.stderr)
+        sys.exit(1)
 
     # Reset device to clear any stale state from previous users
     # (e.g., scanner-watch.sh killed mid-transaction)
     print("(resetting USB device...)")
-    dev.reset()
+    try:
+        handle.resetDevice()
+    except usb1.USBErrorNotFound:
+        pass  # re-enumerated; reopened below either way
+    handle.close()
     time.sleep(0.5)
 
-    # Re-find after reset (device handle may be invalidated)
-    dev = usb.core.find(idVendor=VID, idProduct=PID)
-    if dev is None:
+    # Re-open after reset (device handle may be invalidated)
+    handle = _open_handle(ctx)
+    if handle is None:
         print("Device disappeared after reset!", file=sys.stderr)
         sys.exit(1)
 
-    try:
-        if dev.is_kernel_driver_active(0):
-            dev.detach_kernel_driver(0)
-    except (usb.core.USBError, NotImplementedError):
-        pass
-
-    dev.set_configuration()
-    usb.util.claim_interface(dev, 0)
+    handle.setConfiguration(1)
+    handle.claimInterface(0)
 
     # Clear any stalled endpoints
     try:
-        usb.control.clear_feature(dev, usb.control.ENDPOINT_HALT, EP_OUT)
-        usb.control.clear_feature(dev, usb.control.ENDPOINT_HALT, EP_IN)
-    except usb.core.USBError:
+        handle.clearHalt(EP_OUT)
+        handle.clearHalt(EP_IN)
+    except usb1.USBError:
         pass  # Not stalled, that's fine
 
-    return dev
+    # bytearray buffers are used zero-copy by libusb, so the transfers
+    # only need to be filled once.
+    cmd_xfers = {}
+    for cmd in ENVELOPES:
+        cmd_xfers[cmd] = handle.getTransfer()
+        cmd_xfers[cmd].setBulk(EP_OUT, bytearray(cmd), timeout=USB_TIMEOUT_MS)
+    data_xfer = handle.getTransfer()
+    data_xfer.setBulk(EP_IN, bytearray(IN_BUF_LEN), timeout=USB_TIMEOUT_MS)
+    status_xfer = handle.getTransfer()
+    status_xfer.setBulk(EP_IN, bytearray(IN_BUF_LEN), timeout=USB_TIMEOUT_MS)
+
+    return Scanner(ctx, handle, cmd_xfers, data_xfer, status_xfer)
+
+
+_TRANSFER_ERRORS = {
+    usb1.TRANSFER_TIMED_OUT: usb1.USBErrorTimeout,
+    usb1.TRANSFER_STALL: usb1.USBErrorPipe,
+    usb1.TRANSFER_NO_DEVICE: usb1.USBErrorNoDevice,
+    usb1.TRANSFER_OVERFLOW: usb1.USBErrorOverflow,
+}
 
 
-def usb_transact(dev, cmd: bytes, expect_data: bool = True) -> tuple[bytes, bytes | None]:
+def _pending(xfers: list[usb1.USBTransfer]) -> list[usb1.USBTransfer]:
+    return [x for x in xfers if x.isSubmitted()]
+
+
+def _run_transfers(
+    dev: Scanner, xfers: list[usb1.USBTransfer], linger: float | None = None
+) -> None:
+    """
+    Submit all transfers back-to-back, then pump events until they finish.
+
+    With linger set, the last transfer is optional: it is cancelled if
+    still pending linger seconds after all the others have completed.
+    """
+    # Each submit is one USBDEVFS_SUBMITURB ioctl. io_uring can't batch
+    # these: it has no generic ioctl op, usbfs implements no uring_cmd,
+    # and read()/write() on /dev/bus/usb/BBB/DDD aren't bulk transfers.
+    try:
+        for xfer in xfers:
+            xfer.submit()
+        required = xfers if linger is None else xfers[:-1]
+        while _pending(required):
+            dev.ctx.handleEvents()
+        if linger is not None:
+            deadline = time.monotonic() + linger
+            while _pending(xfers) and (remaining := deadline - time.monotonic()) > 0:
+                dev.ctx.handleEventsTimeout(remaining)
+            if _pending(xfers):
+                # Reap a status that landed right at the deadline instead
+                # of racing it with cancel()
+                dev.ctx.handleEventsTimeout(0)
+    finally:
+        # Never leave URBs queued on the pipe (USB error or Ctrl-C mid-poll),
+        # or the next transaction would read this one's responses.
+        for xfer in _pending(xfers):
+            try:
+                xfer.cancel()
+            except (usb1.USBErrorNotFound, usb1.USBErrorNoDevice):
+                pass  # already completed (or device gone); reaped below
+        while _pending(xfers):
+            dev.ctx.handleEvents()
+
+
+def _transfer_result(xfer: usb1.USBTransfer) -> memoryview:
+    """Payload of a finished transfer (a view of its buffer), or the matching USBError."""
+    status = xfer.getStatus()
+    if status != usb1.TRANSFER_COMPLETED:
+        raise _TRANSFER_ERRORS.get(status, usb1.USBErrorIO)()
+    return memoryview(xfer.getBuffer())[: xfer.getActualLength()]
+
+
+def usb_transact(
+    dev: Scanner, cmd: bytes, expect_data: bool = True
+) -> tuple[memoryview, memoryview | None]:
     """
     Execute one Fujitsu USB command transaction.
 
@@ -210,19 +401,43 @@ def usb_transact(dev, cmd: bytes, expect_data: bool = True) -> tuple[bytes, byte
       2. Read data response → EP_IN  (if expect_data)
       3. Read status (0x53) → EP_IN  (always, to keep pipe clean)
 
-    Returns (data_or_status, status_or_None).
+    The IN transfers are submitted together with the OUT one; the kernel
+    queues them on the endpoint, so the whole exchange is a single event
+    wait rather than three blocking round-trips.
+
+    Envelopes in ENVELOPES reuse their pre-filled transfer; any other
+    make_envelope() output gets a one-off transfer.
+
+    Returns (data_or_status, status_or_None). These are views of the
+    transfers' own buffers, valid only until the next usb_transact();
+    copy anything that has to outlive it.
     """
-    dev.write(EP_OUT, cmd, timeout=1000)
-    resp1 = bytes(dev.read(EP_IN, 512, timeout=1000))
+    cmd_xfer = dev.cmd_xfers.get(cmd)
+    if cmd_xfer is None:
+        # Ad-hoc command, e.g. a CDB tried while mapping a new model
+        cmd_xfer = dev.handle.getTransfer()
+        cmd_xfer.setBulk(EP_OUT, bytearray(cmd), timeout=USB_TIMEOUT_MS)
+    xfers = [cmd_xfer, dev.data_xfer]
+    linger = None
+    if expect_data:
+        # The status IN is already queued behind the data IN, so it
+        # completes as soon as the device sends it. Like the old
+        # synchronous read, give up STATUS_TIMEOUT_MS after the data phase.
+        xfers.append(dev.status_xfer)
+        linger = STATUS_TIMEOUT_MS / 1000
+    _run_transfers(dev, xfers, linger)
+
+    _transfer_result(cmd_xfer)
+    resp1 = _transfer_result(dev.data_xfer)
 
     if not expect_data:
         return resp1, None
 
-    # Try to read the status phase
-    try:
-        resp2 = bytes(dev.read(EP_IN, 512, timeout=200))
-    except usb.core.USBTimeoutError:
+    # A missing status phase is tolerated, as before
+    if dev.status_xfer.getStatus() in (usb1.TRANSFER_TIMED_OUT, usb1.TRANSFER_CANCELLED):
         resp2 = None
+    else:
+        resp2 = _transfer_result(dev.status_xfer)
 
     return resp1, resp2
 
@@ -233,18 +448,62 @@ def test_unit_ready(dev) -> bool:
     return len(resp) > 0 and resp[0] == 0x53
 
 
-def get_hw_status(dev) -> HWStatus:
-    """Send GET_HW_STATUS and decode the response."""
+def read_hw_status(dev) -> memoryview:
+    """Send GET_HW_STATUS and return the raw response (see usb_transact)."""
     data, status = usb_transact(dev, GHS_CMD, expect_data=True)
 
     # If we got a 0x53 status instead of data, the command may have
     # been rejected or we have a protocol mismatch. Report it.
     if data and data[0] == 0x53 and len(data) == 13:
         print(f"  WARNING: got status 0x53 instead of data. Trying data from status phase...")
-        if status and len(status) >= 12:
+        if status and len(status) >= HW_STATUS_LEN:
             data = status
 
-    return HWStatus.from_response(data)
+    return data
+
+
+def get_hw_status(dev) -> HWStatus:
+    """Send GET_HW_STATUS and decode the response."""
+    return HWStatus.from_response(read_hw_status(dev))
+
+
+def pace(tick: float, interval: float = POLL_INTERVAL) -> float:
+    """
+    Sleep until interval after tick (a time.monotonic() stamp) and return
+    the new tick. Time spent in the poll itself counts toward the
+    interval; if we're already late, poll again immediately without
+    trying to catch up.
+    """
+    target = tick + interval
+    delay = target - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+        return target
+    return time.monotonic()
+
+
+def next_interval(tick: float, last_change: float) -> float:
+    """Poll fast for BURST_WINDOW after a change to catch button transients."""
+    return BURST_INTERVAL if tick - last_change < BURST_WINDOW else POLL_INTERVAL
+
+
+def poll_batch(dev: Scanner, n: int, interval: float = POLL_INTERVAL) -> bytearray:
+    """
+    Take n GET_HW_STATUS readings, interval seconds apart.
+
+    Returns the raw responses packed back-to-back, HW_STATUS_LEN bytes
+    per row (short responses are zero-padded). Decode with
+    HWStatus.from_responses().
+    """
+    rows = bytearray(n * HW_STATUS_LEN)
+    tick = time.monotonic()
+    for i in range(n):
+        if i:
+            tick = pace(tick, interval)
+        data = read_hw_status(dev)[:HW_STATUS_LEN]
+        start = i * HW_STATUS_LEN
+        rows[start : start + len(data)] = data
+    return rows
 
 
 # --- Modes ---
@@ -283,17 +542,23 @@ def mode_raw(dev):
     """Continuous raw hex output, one line per poll."""
     print(f"{'time':>12s} | {'raw hex':40s} | hop adf btn")
     print("-" * 72)
+    prev = None
+    tick = time.monotonic()
+    last_change = float("-inf")
     while True:
         try:
             hw = get_hw_status(dev)
-            ts = time.strftime("%H:%M:%S") + f".{int(time.time() * 10) % 10}"
+            if prev is not None and hw.raw_int != prev.raw_int:
+                last_change = tick
+            prev = hw
+            ts = time.strftime("%H:%M:%S") + f".{int(time.time() * 100) % 100:02d}"
             print(
                 f"{ts:>12s} | {hex_of(hw.raw):40s} | "
                 f"{'Y' if hw.hopper else '.'} "
                 f"{'O' if hw.adf_open else '.'} "
                 f"{'B' if hw.scan_sw else '.'}"
             )
-            time.sleep(0.1)
+            tick = pace(tick, next_interval(tick, last_change))
         except KeyboardInterrupt:
             break
 
@@ -306,6 +571,8 @@ def mode_monitor(dev):
 
     prev = None
     poll_count = 0
+    tick = time.monotonic()
+    last_change = float("-inf")
     while True:
         try:
             hw = get_hw_status(dev)
@@ -323,6 +590,7 @@ def mode_monitor(dev):
             else:
                 changes = hw.diff(prev)
                 if changes:
+                    last_change = tick
                     ts = time.strftime("%H:%M:%S")
                     print(f"[{ts}] STATE CHANGE (poll #{poll_count}):")
                     for c in changes:
@@ -331,11 +599,11 @@ def mode_monitor(dev):
                     print()
 
             prev = hw
-            time.sleep(0.1)
+            tick = pace(tick, next_interval(tick, last_change))
         except KeyboardInterrupt:
             print(f"\nDone. {poll_count} polls.")
             break
-        except usb.core.USBError as e:
+        except usb1.USBError as e:
             print(f"USB error: {e} — retrying in 1s...", file=sys.stderr)
             time.sleep(1)
 
@@ -357,34 +625,35 @@ def mode_discover(dev):
         ("REMOVE the sheet of paper", 5),
     ]
 
-    snapshots: list[tuple[str, HWStatus]] = []
+    # One packed HW_STATUS_LEN-byte row per action, decoded for the report
+    snapshot_rows = bytearray(len(actions) * HW_STATUS_LEN)
 
-    for description, settle_secs in actions:
+    for k, (description, settle_secs) in enumerate(actions):
         input(f">>> {description}, then press Enter... ")
         print(f"  reading (waiting {settle_secs}s for settle)...")
         time.sleep(0.5)
 
         # Take several readings to confirm stability
-        readings = []
-        for _ in range(settle_secs * 10):
-            readings.append(get_hw_status(dev))
-            time.sleep(0.1)
-
-        # Use last stable reading
-        hw = readings[-1]
-        snapshots.append((description, hw))
-        print(f"  raw: {hex_of(hw.raw)}")
-        for i in range(12):
-            b = hw.raw[i] if i < len(hw.raw) else 0
+        n = settle_secs * 10
+        modal, counts = bit_stability(poll_batch(dev, n))
+
+        # Use the most common value of each byte across the readings
+        snapshot_rows[k * HW_STATUS_LEN : (k + 1) * HW_STATUS_LEN] = modal
+        print(f"  raw: {hex_of(modal)}")
+        for i, b in enumerate(modal):
             print(f"    [{i:2d}] 0x{b:02x} = {bits_of(b)}")
+        for i, bit_counts in enumerate(counts):
+            for bit, count in enumerate(bit_counts):
+                if 0 < count < n:
+                    print(f"  unstable: byte[{i}] bit {bit} set in {count}/{n} readings")
         print()
 
     # Diff report
     print("=" * 60)
     print("DIFF REPORT")
     print("=" * 60)
-    baseline = snapshots[0][1]
-    for desc, hw in snapshots[1:]:
+    baseline, *snapshots = HWStatus.from_responses(snapshot_rows)
+    for (desc, _), hw in zip(actions[1:], snapshots):
         changes = hw.diff(baseline)
         print(f"\n'{desc}' vs baseline:")
         if changes:
@@ -420,11 +689,12 @@ def main():
             sys.exit(1)
         fn(dev)
     finally:
-        usb.util.release_interface(dev, 0)
+        dev.handle.releaseInterface(0)
         try:
-            dev.attach_kernel_driver(0)
-        except (usb.core.USBError, NotImplementedError):
+            dev.handle.attachKernelDriver(0)
+        except usb1.USBError:
             pass
+        dev.ctx.close()
 
 
 if __name__ == "__main__":